@@ -2,6 +2,7 @@
 import argparse
 import logging
 import os
+import random
 
 import re
 import urllib.request
@@ -10,10 +11,17 @@ from pprint import pprint
 
 import sys
 
+from src.bundle import Bundle
 from src.core import DB, Lant
 
 logger = logging.getLogger()
 
+# `var board_size` in index.html, the only size the page lays out
+INDEX_HTML_BOARD_SIZE = 5
+# Playing rounds with the whole list is slow and the most frequent words decide the dice set
+# anyway. The solutions shown to players should not miss any word though.
+SIMULATION_WORDLIST_CAP = 5000
+
 
 def configure_logging(level=logging.DEBUG, method='log.txt'):
     """
@@ -38,6 +46,16 @@ def configure_logging(level=logging.DEBUG, method='log.txt'):
         )
 
 
+def int_between(low, high):
+    """An argparse type for integers in a closed range."""
+    def checked(value):
+        value = int(value)
+        if not low <= value <= high:
+            raise argparse.ArgumentTypeError('%s is not between %s and %s' % (value, low, high))
+        return value
+    return checked
+
+
 def parse_args():
     parser = argparse.ArgumentParser()
     # 5 is my favourite size, 4 is original, I imagine larger boards will appeal to boggle nerds too
@@ -48,7 +66,10 @@ def parse_args():
     parser.add_argument('-i', '--iso', help='693-3 language code', type=str, required=True)
     parser.add_argument('--language-dir', help='language base dir', type=str, default='data')
     parser.add_argument('--word-list-file-name', type=str, default='wordlist')
-    parser.add_argument('--wordlist-cap', help="Cap wordlist to x.", type=int, default=5000)
+    parser.add_argument(
+        '--wordlist-cap', type=int,
+        help='Cap wordlist to x. Defaults to %s when playing rounds, export_bundle does not cap '
+             'unless told to.' % SIMULATION_WORDLIST_CAP)
     parser.add_argument('-d', '--db-name', help='Results ddb filename', default='db.sqlite3')
     parser.add_argument(
         '-L', '--logging-level',
@@ -75,6 +96,15 @@ def parse_args():
         description='Download a qord list from hermitdave/FrequencyWords')
     opensubtitles.add_argument('--iso2', help='iso-639-2 language identifier', required=True)
 
+    export_bundle = subparsers.add_parser(
+        'export_bundle',
+        description='Pre-solve seeded boards of the best dice set for the off-line game')
+    export_bundle.add_argument('-n', '--boards', type=int_between(1, 2 ** 32 - 1), default=10000)
+    export_bundle.add_argument('-s', '--seed', type=int, default=0)
+    export_bundle.add_argument('--block-size', help='Boards compressed together',
+                               type=int_between(1, Bundle.MAX_BLOCK_SIZE), default=64)
+    export_bundle.add_argument('-o', '--output', help='Defaults to <iso>_<board size>.bundle')
+
     namespace = parser.parse_args()
 
     if namespace.logging_level == 'NO_LOGS':
@@ -158,6 +188,43 @@ def get_opensubtitle_frequency_list(iso2):
     sys.stdout.write(without_counts)
 
 
+def get_lant(args, wordlist_cap):
+    return Lant(
+        iso=args.iso,
+        board_size=args.board_size,
+        min_word_length=args.min_word_length,
+        language_dir=args.language_dir,
+        wordlist_filename=args.word_list_file_name,
+        wordlist_cap=wordlist_cap
+    )
+
+
+def export_solution_bundle(lant, db, boards, seed, block_size, output):
+    """
+    Deal a seeded series of boards off the best recorded dice set, solve them all and write them
+    as a bundle index.html can read solutions from without the webserver.
+
+    """
+    bundle = Bundle(lant.board_size, block_size)
+    if lant.board_size != INDEX_HTML_BOARD_SIZE:
+        sys.stderr.write(
+            'Warning: index.html only renders %sx%s boards, it will refuse this bundle.\n'
+            % (INDEX_HTML_BOARD_SIZE, INDEX_HTML_BOARD_SIZE))
+    dice_set = db.best_dice_set(lant.iso, lant.board_size)
+    assert dice_set, 'No games recorded for %r on a %sx%s board, play some rounds first.' % (
+        lant.iso, lant.board_size, lant.board_size)
+    logger.info('Best dice set %s' % dice_set)
+    logger.info('Solving against %s words.' % len(lant.frequent_words_capped))
+    random.seed(seed)
+    solved_boards = lant.solve_batch(dice_set, lant.deal_boards(dice_set, boards))
+    output = output or '%s_%s.bundle' % (lant.iso, lant.board_size)
+    words = bundle.write(output, solved_boards)
+    sys.stdout.write(
+        '%s boards solved against %s words of %s, %s words, %s bytes written to %s\n' % (
+            boards, len(lant.frequent_words_capped), lant.wordlist_filepath, words,
+            os.path.getsize(output), output))
+
+
 def main():
     args = parse_args()
     configure_logging(logging._nameToLevel[args.logging_level], args.log_method)
@@ -170,18 +237,16 @@ def main():
         download_gutenberg_texts(args.iso, args.etextno, args.language_dir)
     elif args.subcommand == 'opensubtitle_frequency_list':
         get_opensubtitle_frequency_list(args.iso2)
+    elif args.subcommand == 'export_bundle':
+        wordlist_cap = sys.maxsize if args.wordlist_cap is None else args.wordlist_cap
+        export_solution_bundle(
+            get_lant(args, wordlist_cap), db, args.boards, args.seed, args.block_size, args.output)
     else:
         logger.info('clear screen \x1bc')
 
-        lant = Lant(
-            iso=args.iso,
-            board_size=args.board_size,
-            min_word_length=args.min_word_length,
-            language_dir=args.language_dir,
-            wordlist_filename=args.word_list_file_name,
-            wordlist_cap=args.wordlist_cap
-        )
-        wordlist_size = args.wordlist_cap or len(lant.frequent_words_capped)
+        wordlist_cap = SIMULATION_WORDLIST_CAP if args.wordlist_cap is None else args.wordlist_cap
+        lant = get_lant(args, wordlist_cap)
+        wordlist_size = wordlist_cap or len(lant.frequent_words_capped)
         occurrence = lant.get_character_occurrence_in_texts()
         initial_board_string = lant.get_board_string(occurrence)
 
@@ -0,0 +1,144 @@
+# encoding: utf-8
+"""
+Precomputed solutions for the off-line game.
+
+index.html can only show solutions by asking the webserver's /solver. A bundle carries a seeded
+set of boards together with their solutions so the page can show them without a server.
+
+Layout, all integers big-endian (the default of javascript's DataView):
+
+    header   '>4sBBHII'  magic, version, board_size, block_size, boards count, words count
+    words    uint32 length + zlib('\\n'.join(words)), the shared per-language word table
+    index    (blocks + 1) * uint32, offsets of the blocks relative to the end of the index
+    blocks   zlib compressed runs of block_size board records
+
+A board record is:
+
+    uint16   length of the board letters in utf-8 bytes
+    bytes    board letters, row after row
+    uint16   solutions count
+    then for each solution:
+        uint32   word id, index into the word table
+        uint8    path length
+        bytes    path, each cell packed as y * board_size + x
+
+Boards are grouped in blocks as a single board compresses poorly, the reader only inflates the
+block the requested board id lives in.
+
+Limits: a cell has to fit a byte so boards have at most 256 cells (16x16), block_size is 1 to
+65535 boards and a board has at most 65535 solutions.
+"""
+import struct
+import zlib
+
+from src.utils import split_by_n
+
+MAGIC = b'LANT'
+VERSION = 1
+HEADER = struct.Struct('>4sBBHII')
+UINT32 = struct.Struct('>I')
+
+
+class Bundle(object):
+    """
+    Writes and reads solution bundles, see the module docstring for the format.
+
+    >>> Bundle(5).write('afr.bundle', [(board, solutions), ...])
+    >>> Bundle.read_board('afr.bundle', 42)
+    (['abcde', ...], [('kayak', ((0, 0), (1, 0), ...)), ...])
+    """
+    MAX_CELLS = 256
+    MAX_BLOCK_SIZE = 65535
+
+    def __init__(self, board_size, block_size=64):
+        assert 0 < board_size * board_size <= self.MAX_CELLS, \
+            'board size %s too big, cells are packed in a byte.' % board_size
+        assert 0 < block_size <= self.MAX_BLOCK_SIZE, \
+            'block size must be 1 to %s (%s).' % (self.MAX_BLOCK_SIZE, block_size)
+        self.board_size = board_size
+        self.block_size = block_size
+
+    def write(self, filename, solved_boards):
+        """
+        solved_boards is a sequence of (board, solutions), solutions being (word, path) pairs as
+        yielded by Solver.solve(with_path=True). Only the first path of every word is kept.
+        Return the number of words in the word table.
+        """
+        assert solved_boards, 'Nothing to write, a bundle needs at least one board.'
+        solved_boards = [
+            (board, self.first_path_per_word(solutions)) for board, solutions in solved_boards]
+        words = sorted(set(word for _, solutions in solved_boards for word in solutions))
+        word_ids = {word: word_id for word_id, word in enumerate(words)}
+
+        blocks = [
+            zlib.compress(b''.join(self.pack_board(board, solutions, word_ids)
+                                   for board, solutions in chunk), 9)
+            for chunk in split_by_n(solved_boards, self.block_size)
+        ]
+        offsets = [0]
+        for block in blocks:
+            offsets.append(offsets[-1] + len(block))
+        packed_words = zlib.compress('\n'.join(words).encode('utf-8'), 9)
+
+        with open(filename, 'wb') as f:
+            f.write(HEADER.pack(
+                MAGIC, VERSION, self.board_size, self.block_size, len(solved_boards), len(words)))
+            f.write(UINT32.pack(len(packed_words)))
+            f.write(packed_words)
+            f.write(b''.join(UINT32.pack(offset) for offset in offsets))
+            f.write(b''.join(blocks))
+        return len(words)
+
+    @staticmethod
+    def first_path_per_word(solutions):
+        paths = {}
+        for word, path in solutions:
+            paths.setdefault(word, path)
+        return paths
+
+    def pack_board(self, board, solutions, word_ids):
+        letters = ''.join(board).encode('utf-8')
+        packed = [struct.pack('>H', len(letters)), letters, struct.pack('>H', len(solutions))]
+        for word in sorted(solutions, key=word_ids.get):
+            path = solutions[word]
+            packed.append(struct.pack('>IB', word_ids[word], len(path)))
+            packed.append(bytes(y * self.board_size + x for x, y in path))
+        return b''.join(packed)
+
+    @classmethod
+    def read_board(cls, filename, board_id):
+        """
+        Return (board, solutions) for a board id, in the shapes Lant.get_board and
+        Solver.solve(with_path=True) use. Mirrors what index.html does on its side.
+        """
+        with open(filename, 'rb') as f:
+            magic, version, board_size, block_size, boards, _ = HEADER.unpack(
+                f.read(HEADER.size))
+            assert magic == MAGIC and version == VERSION, 'Not a lant bundle v%s' % VERSION
+            assert 0 <= board_id < boards, 'Board %s out of range (%s boards)' % (board_id, boards)
+            words_length, = UINT32.unpack(f.read(UINT32.size))
+            words = zlib.decompress(f.read(words_length)).decode('utf-8').split('\n')
+            block_no, position_in_block = divmod(board_id, block_size)
+            blocks = -(-boards // block_size)
+            index_start = f.tell()
+            f.seek(index_start + block_no * UINT32.size)
+            start, end = struct.unpack('>II', f.read(2 * UINT32.size))
+            f.seek(index_start + (blocks + 1) * UINT32.size + start)
+            block = zlib.decompress(f.read(end - start))
+
+        cursor = 0
+        for _ in range(position_in_block + 1):
+            letters_length, = struct.unpack_from('>H', block, cursor)
+            letters = block[cursor + 2:cursor + 2 + letters_length].decode('utf-8')
+            cursor += 2 + letters_length
+            solutions_count, = struct.unpack_from('>H', block, cursor)
+            cursor += 2
+            solutions = []
+            for _ in range(solutions_count):
+                word_id, path_length = struct.unpack_from('>IB', block, cursor)
+                cursor += 5
+                path = tuple(divmod(cell, board_size)[::-1]
+                             for cell in block[cursor:cursor + path_length])
+                cursor += path_length
+                solutions.append((words[word_id], path))
+        return list(split_by_n(letters, board_size)), solutions
@@ -206,6 +206,33 @@ class Lant(object):
     def solve(self, board):
         return Solver(board, self.min_word_length, self.frequent_words_capped).solve()
 
+    def deal_boards(self, dice_set, count):
+        """
+        Shake the box and deal `count` boards off a single dice set, the way a game night would.
+        Seed the random module beforehand for a reproducible series.
+        """
+        dice_array = self.dice_array_from_board_string(dice_set)
+        for _ in range(count):
+            randomized_dice_array = self.shake_the_box(dice_array)
+            yield self.get_board(self.rotate_the_dice_and_pick(randomized_dice_array))
+
+    @elapsed(logger.info, 'Batch solve took')
+    def solve_batch(self, dice_set, boards):
+        """
+        Solve many boards dealt off the same dice set. Solver cuts the word list down to the
+        board's letters each time, doing it once for the whole dice set first makes every
+        board start from a much shorter list.
+        Return a list of (board, [(word, path), ...]).
+        """
+        dice_set_words = Solver.reduce_dictionary(
+            dice_set, self.min_word_length, self.frequent_words_capped)
+        logger.debug('Dice set cuts word list down to %s words.' % len(dice_set_words))
+        solved = []
+        for board in boards:
+            solver = Solver(board, self.min_word_length, dice_set_words)
+            solved.append((board, list(solver.solve(with_path=True))))
+        return solved
+
     @elapsed(logger.debug, 'Round took')
     def play_round(self, initial_board_string, round_length=50):
         """
@@ -249,21 +276,27 @@ class Solver(object):
     def __init__(self, board, min_word_length, dictionary):
         self.board = board
         nrows, ncols = len(board), len(board[0])
-        # A dictionary word that could be a solution must use only the boards's
-        # letters and have length >= min_word_length. (With a case-insensitive match.)
-        usable_chars = ''.join(set(''.join(board)))
-        logger.debug("I'm using reduced scope %r." % usable_chars)
-        # FIXME: this regex needs to escape certain characters like `-`,
-        # they are not playable by definition now but who knows, maybe in the future, hyphen
-        # will be ok
-        bogglable = re.compile('[%s]{%s,}$' % (usable_chars, min_word_length), re.I | re.U).match
-        words = set(word for word in dictionary if bogglable(word))
+        words = self.reduce_dictionary(''.join(board), min_word_length, dictionary)
         logger.debug('Word list cut down to %s words.' % len(words))
         self.words = words
         self.prefixes = set(word[:i] for word in words for i in range(2, len(word) + 1))
         self.ncols = ncols
         self.nrows = nrows
 
+    @staticmethod
+    def reduce_dictionary(letters, min_word_length, dictionary):
+        """
+        A dictionary word that could be a solution must use only the given letters and have
+        length >= min_word_length. (With a case-insensitive match.)
+        """
+        usable_chars = ''.join(set(letters))
+        logger.debug("I'm using reduced scope %r." % usable_chars)
+        # FIXME: this regex needs to escape certain characters like `-`,
+        # they are not playable by definition now but who knows, maybe in the future, hyphen
+        # will be ok
+        bogglable = re.compile('[%s]{%s,}$' % (usable_chars, min_word_length), re.I | re.U).match
+        return set(word for word in dictionary if bogglable(word))
+
     def __extending(self, prefix, path):
         if prefix in self.words:
             yield (prefix, path)
@@ -314,6 +347,19 @@ class DB(object):
             (language, board_x, board_y, dice_set, games_played, average_score, wordlist_size)
         )
 
+    def best_dice_set(self, language, board_size):
+        """Return the dice set with the highest average score for a square board, or None."""
+        self.cursor.execute('''
+            SELECT dice_set
+            FROM games
+            WHERE language = ? AND board_x = ? AND board_y = ?
+            ORDER BY average_score DESC
+            LIMIT 1
+            ;
+        ''', (language, board_size, board_size))
+        row = self.cursor.fetchone()
+        return row and row[0]
+
     def report_results_breakdown(self):
         self.cursor.execute('''
             SELECT MAX(average_score), COUNT(*), language, board_x, board_y, wordlist_size, dice_set
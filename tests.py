@@ -1,4 +1,9 @@
-from src.core import Solver
+import os
+import random
+import tempfile
+
+from src.bundle import Bundle
+from src.core import DB, Lant, Solver
 
 
 def test_solver():
@@ -25,5 +30,53 @@ def test_solver():
     assert 'lemma' in s2_solution
 
 
+def test_bundle_round_trip():
+    wordlist = ['test', 'kayak', 'lemma', 'ёжик']
+    boards = [
+        ['____l', 't_k_e', 'e_a_m', 's_y_m', 't___a'],
+        ['test_', 'y____', 'a____', 'k____', '_____'],
+        ['ёжик_', '_____', '_____', '_____', '_____'],
+    ]
+    solved_boards = [(board, list(Solver(board, 4, wordlist).solve(with_path=True)))
+                     for board in boards]
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'test.bundle')
+        assert Bundle(5, block_size=2).write(filename, solved_boards) == 3
+        for board_id, (board, solutions) in enumerate(solved_boards):
+            read_board, read_solutions = Bundle.read_board(filename, board_id)
+            assert read_board == board
+            assert read_solutions == sorted(Bundle.first_path_per_word(solutions).items())
+
+
+def test_best_dice_set():
+    db = DB(':memory:').init_schema()
+    assert db.best_dice_set('afr', 5) is None
+    db.record_round('afr', 5, 5, 'good', 50, 10.0, 5000)
+    db.record_round('afr', 5, 5, 'best', 50, 12.5, 5000)
+    db.record_round('afr', 5, 5, 'bad', 50, 2.0, 5000)
+    db.record_round('afr', 4, 4, 'smaller board', 50, 99.0, 5000)
+    db.record_round('eng', 5, 5, 'other language', 50, 99.0, 5000)
+    assert db.best_dice_set('afr', 5) == 'best'
+    assert db.best_dice_set('afr', 4) == 'smaller board'
+
+
+def test_deal_and_solve_batch():
+    lant = Lant('afr', 5, wordlist_cap=3000)
+    dice_set = lant.get_board_string(lant.get_character_occurrence_in_texts())
+
+    random.seed(7)
+    boards = list(lant.deal_boards(dice_set, 5))
+    random.seed(7)
+    assert list(lant.deal_boards(dice_set, 5)) == boards
+
+    for board, solutions in lant.solve_batch(dice_set, boards):
+        full = Solver(board, lant.min_word_length, lant.frequent_words_capped)
+        assert solutions == list(full.solve(with_path=True))
+
+
 if __name__ == '__main__':
     test_solver()
+    test_bundle_round_trip()
+    test_best_dice_set()
+    test_deal_and_solve_batch()